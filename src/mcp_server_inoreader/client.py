@@ -1,7 +1,10 @@
 import ssl
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
+import ijson
+import orjson
 from cachetools import TTLCache
 
 from .config import Config
@@ -17,20 +20,42 @@ class InoreaderClient:
         self.cache = TTLCache(maxsize=100, ttl=Config.CACHE_TTL)
         self.session: aiohttp.ClientSession | None = None
         self.auth_token: str | None = None
+        # ETag validators and their bodies outlive the TTL cache so expired
+        # entries can be revalidated with If-None-Match instead of refetched.
+        self._validators: dict[str, tuple[str, Any]] = {}
+        self._headers: dict[str, str] = {}
+        self._timeout = aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT)
+
+    @classmethod
+    def _build_connector(cls) -> aiohttp.TCPConnector:
+        """Build the TCP connector with pooling and DNS-cache settings.
+
+        The default SSL context keeps certificate verification on and lets
+        TLS session resumption skip full handshakes on new connections.
+        """
+        return aiohttp.TCPConnector(
+            ssl=ssl.create_default_context(),
+            limit=64,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
 
     async def __aenter__(self):
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        self.session = aiohttp.ClientSession(connector=connector)
-        await self._authenticate()
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(connector=self._build_connector(), connector_owner=True)
+            await self._authenticate()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
+        self.auth_token = None
 
     async def _authenticate(self):
         """Authenticate with Inoreader API."""
@@ -45,20 +70,27 @@ class InoreaderClient:
 
             text = await resp.text()
 
-            for line in text.split("\n"):
-                if line.startswith("Auth="):
-                    self.auth_token = line[5:]
-                    break
+            # Locate the Auth= line with find() instead of splitting the
+            # whole response into a list of lines.
+            if text.startswith("Auth="):
+                start = 5
+            else:
+                idx = text.find("\nAuth=")
+                start = idx + 6 if idx != -1 else -1
+
+            if start != -1:
+                end = text.find("\n", start)
+                self.auth_token = text[start:] if end == -1 else text[start:end]
 
             if not self.auth_token:
                 raise Exception("No auth token received")
 
-    def _get_headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"GoogleLogin auth={self.auth_token}",
-            "AppId": self.app_id,
-            "AppKey": self.app_key,
-        }
+            self._headers = {
+                "Authorization": f"GoogleLogin auth={self.auth_token}",
+                "AppId": self.app_id,
+                "AppKey": self.app_key,
+                "Accept-Encoding": "gzip",
+            }
 
     async def _request(
         self,
@@ -68,34 +100,96 @@ class InoreaderClient:
         data: dict | None = None,
     ) -> Any:
         url = f"{self.base_url}/{endpoint}"
-        headers = self._get_headers()
-        timeout = aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT)
 
-        async with self.session.request(
-            method, url, params=params, data=data, headers=headers, timeout=timeout
-        ) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise Exception(f"API request failed: {resp.status} - {text}")
+        for attempt in range(2):
+            async with self.session.request(
+                method, url, params=params, data=data, headers=self._headers, timeout=self._timeout
+            ) as resp:
+                if resp.status == 401 and attempt == 0:
+                    # Auth token expired; refresh it and retry once.
+                    self.auth_token = None
+                    await self._authenticate()
+                    continue
+
+                if resp.status != 200:
+                    text = await resp.text()
+                    raise Exception(f"API request failed: {resp.status} - {text}")
+
+                content_type = resp.headers.get("Content-Type", "")
+
+                if "application/json" in content_type:
+                    return orjson.loads(await resp.read())
+                else:
+                    return await resp.text()
+
+    async def _cached_request(self, endpoint: str, cache_key: str, params: dict | None = None) -> Any:
+        """GET with ETag revalidation; fresh entries are served from the TTL cache."""
+        if cache_key in self.cache:
+            return self.cache[cache_key]
 
-            content_type = resp.headers.get("Content-Type", "")
+        etag, stale = self._validators.get(cache_key, (None, None))
 
-            if "application/json" in content_type:
-                return await resp.json()
-            else:
-                return await resp.text()
+        url = f"{self.base_url}/{endpoint}"
 
-    async def get_subscription_list(self) -> list[dict]:
-        """Get list of subscribed feeds."""
-        cache_key = "subscription_list"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        for attempt in range(2):
+            # Copy only when a validator needs to be attached; the shared
+            # header dict must not be mutated.
+            headers = {**self._headers, "If-None-Match": etag} if etag else self._headers
+
+            async with self.session.get(url, params=params, headers=headers, timeout=self._timeout) as resp:
+                if resp.status == 304:
+                    # Unchanged upstream: reuse the stale body and refresh its TTL.
+                    self.cache[cache_key] = stale
+                    return stale
+
+                if resp.status == 401 and attempt == 0:
+                    self.auth_token = None
+                    await self._authenticate()
+                    continue
+
+                if resp.status != 200:
+                    text = await resp.text()
+                    raise Exception(f"API request failed: {resp.status} - {text}")
+
+                if "application/json" in resp.headers.get("Content-Type", ""):
+                    body = orjson.loads(await resp.read())
+                else:
+                    body = await resp.text()
+
+                new_etag = resp.headers.get("ETag")
+                if new_etag:
+                    self._validators[cache_key] = (new_etag, body)
+                self.cache[cache_key] = body
+                return body
+
+    async def _stream_items(self, endpoint: str, params: dict) -> AsyncIterator[dict]:
+        """Yield items from a stream endpoint as they are parsed off the wire."""
+        url = f"{self.base_url}/{endpoint}"
+
+        for attempt in range(2):
+            async with self.session.get(url, params=params, headers=self._headers, timeout=self._timeout) as resp:
+                if resp.status == 401 and attempt == 0:
+                    self.auth_token = None
+                    await self._authenticate()
+                    continue
+
+                if resp.status != 200:
+                    text = await resp.text()
+                    raise Exception(f"API request failed: {resp.status} - {text}")
 
-        result = await self._request("GET", "subscription/list")
-        subscriptions = result.get("subscriptions", [])
+                # Non-JSON bodies (e.g. a bare "OK") mean no items, matching
+                # the {"items": []} fallback of the eager methods.
+                if "application/json" not in resp.headers.get("Content-Type", ""):
+                    return
 
-        self.cache[cache_key] = subscriptions
-        return subscriptions
+                async for item in ijson.items(resp.content, "items.item"):
+                    yield item
+                return
+
+    async def get_subscription_list(self) -> list[dict]:
+        """Get list of subscribed feeds."""
+        result = await self._cached_request("subscription/list", "subscription_list")
+        return result.get("subscriptions", [])
 
     async def get_stream_contents(
         self,
@@ -127,6 +221,31 @@ class InoreaderClient:
 
         return result
 
+    def get_stream_contents_iter(
+        self,
+        stream_id: str | None = None,
+        count: int = 50,
+        exclude_read: bool = True,
+        newer_than: int | None = None,
+    ) -> AsyncIterator[dict]:
+        """Iterate articles from a stream without buffering the full response."""
+        params = {
+            "n": min(count, Config.MAX_ARTICLES_PER_REQUEST),
+            "output": "json",
+        }
+
+        if exclude_read:
+            params["xt"] = "user/-/state/com.google/read"
+
+        if newer_than:
+            params["ot"] = newer_than
+
+        endpoint = (
+            f"stream/contents/{stream_id}" if stream_id else "stream/contents/user/-/state/com.google/reading-list"
+        )
+
+        return self._stream_items(endpoint, params)
+
     async def get_stream_item_contents(self, item_ids: list[str]) -> dict:
         """Get full content for specific items."""
         if not item_ids:
@@ -169,7 +288,25 @@ class InoreaderClient:
 
         return result
 
+    def search_iter(
+        self,
+        query: str,
+        count: int = 50,
+        newer_than: int | None = None,
+    ) -> AsyncIterator[dict]:
+        """Iterate search results without buffering the full response."""
+        params = {
+            "q": query,
+            "n": min(count, Config.MAX_ARTICLES_PER_REQUEST),
+            "output": "json",
+        }
+
+        if newer_than:
+            params["ot"] = newer_than
+
+        return self._stream_items("stream/contents/user/-/state/com.google/search", params)
+
     async def get_unread_count(self) -> dict:
         """Get unread counts for all feeds."""
-        result = await self._request("GET", "unread-count")
+        result = await self._cached_request("unread-count", "unread_count")
         return result.get("unreadcounts", [])
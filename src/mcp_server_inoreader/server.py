@@ -8,10 +8,13 @@ from fastmcp.server.lifespan import lifespan
 
 @lifespan
 async def app_lifespan(server: FastMCP):
-    """Application lifespan managing configuration.
+    """Application lifespan managing configuration and the shared API client.
 
-    Validates that required environment variables are set.
+    Validates that required environment variables are set, then opens a
+    single InoreaderClient so the connection pool and auth token are
+    reused across tool calls.
     """
+    from .client import InoreaderClient
     from .config import Config
 
     Config.validate()
@@ -22,7 +25,12 @@ async def app_lifespan(server: FastMCP):
     print("=" * 50, file=sys.stderr)
     print(file=sys.stderr)
 
-    yield {}
+    client = InoreaderClient()
+    await client.__aenter__()
+    try:
+        yield {"client": client}
+    finally:
+        await client.close()
 
 
 mcp = FastMCP(
@@ -1,5 +1,9 @@
 """Inoreader MCP Tools - FastMCP tool implementations."""
 
+import asyncio
+import heapq
+from operator import itemgetter
+
 from fastmcp import Context
 
 from .client import InoreaderClient
@@ -10,27 +14,47 @@ from .utils import (
     format_article_list,
     format_feed_list,
     parse_article,
-    parse_feed,
+    timestamp_to_iso,
 )
 
 
+def _get_client(ctx: Context) -> InoreaderClient:
+    """Get the shared client opened by the server lifespan."""
+    return ctx.request_context.lifespan_context["client"]
+
+
 @mcp.tool()
 async def list_feeds(ctx: Context) -> str:
     """List all subscribed feeds in Inoreader."""
     try:
-        async with InoreaderClient() as client:
-            subscriptions = await client.get_subscription_list()
-            feeds = [parse_feed(sub) for sub in subscriptions]
-
-            if not feeds:
-                return "No feeds found in your Inoreader account."
-
-            feeds.sort(key=lambda x: x["title"].lower())
+        client = _get_client(ctx)
+        subscriptions = await client.get_subscription_list()
+
+        if not subscriptions:
+            return "No feeds found in your Inoreader account."
+
+        # format_feed_list only reads title, url and categories, so project
+        # just those instead of the full parse_feed dict.
+        decorated = []
+        for sub in subscriptions:
+            title = sub.get("title", "Untitled")
+            decorated.append(
+                (
+                    title.lower(),
+                    {
+                        "title": title,
+                        "url": sub.get("url", ""),
+                        "categories": [cat.get("label", "") for cat in sub.get("categories", [])],
+                    },
+                )
+            )
+        decorated.sort(key=itemgetter(0))
+        feeds = [feed for _, feed in decorated]
 
-            result = f"Found {len(feeds)} feeds:\n\n"
-            result += format_feed_list(feeds)
+        result = f"Found {len(feeds)} feeds:\n\n"
+        result += format_feed_list(feeds)
 
-            return result
+        return result
     except Exception as e:
         return f"Error listing feeds: {str(e)}"
 
@@ -52,44 +76,41 @@ async def list_articles(
         unread_only: Only show unread articles (default: True)
     """
     try:
-        async with InoreaderClient() as client:
-            newer_than = days_to_timestamp(days) if days else None
+        client = _get_client(ctx)
+        newer_than = days_to_timestamp(days) if days else None
 
-            stream_contents = await client.get_stream_contents(
+        articles = [
+            parse_article(item)
+            async for item in client.get_stream_contents_iter(
                 stream_id=feed_id,
                 count=limit,
                 exclude_read=unread_only,
                 newer_than=newer_than,
             )
+        ]
 
-            if isinstance(stream_contents, str):
-                return "Error: API returned unexpected response format"
-
-            items = stream_contents.get("items", [])
-            articles = [parse_article(item) for item in items]
-
-            if not articles:
-                filters = []
-                if unread_only:
-                    filters.append("unread")
-                if days:
-                    filters.append(f"from the last {days} days")
-                if feed_id:
-                    filters.append(f"in feed {feed_id}")
-
-                filter_str = " ".join(filters) if filters else ""
-                return f"No articles found{' ' + filter_str if filter_str else ''}."
-
-            result = f"Found {len(articles)} articles"
+        if not articles:
+            filters = []
             if unread_only:
-                result += " (unread only)"
+                filters.append("unread")
             if days:
-                result += f" from the last {days} days"
-            result += ":\n\n"
+                filters.append(f"from the last {days} days")
+            if feed_id:
+                filters.append(f"in feed {feed_id}")
+
+            filter_str = " ".join(filters) if filters else ""
+            return f"No articles found{' ' + filter_str if filter_str else ''}."
+
+        result = f"Found {len(articles)} articles"
+        if unread_only:
+            result += " (unread only)"
+        if days:
+            result += f" from the last {days} days"
+        result += ":\n\n"
 
-            result += format_article_list(articles)
+        result += format_article_list(articles)
 
-            return result
+        return result
     except Exception as e:
         return f"Error listing articles: {str(e)}"
 
@@ -109,29 +130,56 @@ async def search_articles(
         days: Search within the last N days (default: 7)
     """
     try:
-        async with InoreaderClient() as client:
-            newer_than = days_to_timestamp(days) if days else None
+        client = _get_client(ctx)
+        newer_than = days_to_timestamp(days) if days else None
 
-            result = await client.search(query=query, count=limit, newer_than=newer_than)
+        articles = [
+            parse_article(item) async for item in client.search_iter(query=query, count=limit, newer_than=newer_than)
+        ]
 
-            items = result.get("items", [])
-            articles = [parse_article(item) for item in items]
+        if not articles:
+            return f"No articles found matching '{query}'"
 
-            if not articles:
-                return f"No articles found matching '{query}'"
+        response = f"Found {len(articles)} articles matching '{query}'"
+        if days:
+            response += f" from the last {days} days"
+        response += ":\n\n"
 
-            response = f"Found {len(articles)} articles matching '{query}'"
-            if days:
-                response += f" from the last {days} days"
-            response += ":\n\n"
-
-            response += format_article_list(articles)
+        response += format_article_list(articles)
 
-            return response
+        return response
     except Exception as e:
         return f"Error searching articles: {str(e)}"
 
 
+def _format_article_content(item: dict) -> str:
+    """Format one stream item with its metadata and full content."""
+    article = parse_article(item)
+
+    content = f"**{article['title']}**\n"
+    content += f"Author: {article['author']}\n"
+    content += f"Feed: {article['feed_title']}\n"
+    content += f"Date: {timestamp_to_iso(article['published'])}\n"
+
+    if article["url"]:
+        content += f"Link: {article['url']}\n"
+    else:
+        content += "Link: No URL available\n"
+
+    content += f"Status: {'Read' if article['is_read'] else 'Unread'}\n"
+
+    if "content" in item:
+        full_content = item["content"].get("content", "")
+        if full_content:
+            content += f"\n---\n\n{full_content}"
+    elif article["summary"]:
+        content += f"\n---\n\n{article['summary']}"
+    else:
+        content += "\n---\n\nNo content available for this article."
+
+    return content
+
+
 @mcp.tool()
 async def get_content(ctx: Context, article_id: str) -> str:
     """Get full content of a specific article.
@@ -140,101 +188,105 @@ async def get_content(ctx: Context, article_id: str) -> str:
         article_id: Article ID to get content for
     """
     try:
-        async with InoreaderClient() as client:
-            result = await client.get_stream_item_contents([article_id])
-            items = result.get("items", [])
-
-            if not items:
-                return f"Article with ID {article_id} not found."
-
-            item = items[0]
-            article = parse_article(item)
-
-            content = f"**{article['title']}**\n"
-            content += f"Author: {article['author']}\n"
-            content += f"Feed: {article['feed_title']}\n"
-            content += f"Date: {article['published_date']}\n"
-
-            if article["url"]:
-                content += f"Link: {article['url']}\n"
-            else:
-                content += "Link: No URL available\n"
-
-            content += f"Status: {'Read' if article['is_read'] else 'Unread'}\n"
-
-            if "content" in item:
-                full_content = item["content"].get("content", "")
-                if full_content:
-                    content += f"\n---\n\n{full_content}"
-            elif article["summary"]:
-                content += f"\n---\n\n{article['summary']}"
-            else:
-                content += "\n---\n\nNo content available for this article."
-
-            return content
+        client = _get_client(ctx)
+        result = await client.get_stream_item_contents([article_id])
+        items = result.get("items", [])
+
+        if not items:
+            return f"Article with ID {article_id} not found."
+
+        return _format_article_content(items[0])
     except Exception as e:
         return f"Error getting article content: {str(e)}"
 
 
 @mcp.tool()
-async def mark_as_read(ctx: Context, article_ids: list[str]) -> str:
-    """Mark articles as read.
+async def get_contents(ctx: Context, article_ids: list[str]) -> str:
+    """Get full content of multiple articles in a single request.
 
     Args:
-        article_ids: List of article IDs to mark as read
+        article_ids: List of article IDs to get content for
     """
     try:
         if not article_ids:
             return "No article IDs provided."
 
-        async with InoreaderClient() as client:
-            chunks = chunk_list(article_ids, 20)
-            success_count = 0
-
-            for chunk in chunks:
-                success = await client.mark_as_read(chunk)
-                if success:
-                    success_count += len(chunk)
-
-            if success_count == len(article_ids):
-                return f"Successfully marked {success_count} article(s) as read."
-            elif success_count > 0:
-                return f"Marked {success_count} out of {len(article_ids)} articles as read."
-            else:
-                return "Failed to mark articles as read."
+        client = _get_client(ctx)
+        result = await client.get_stream_item_contents(article_ids)
+        items = result.get("items", [])
+
+        if not items:
+            return "No articles found for the provided IDs."
+
+        return f"\n\n{'=' * 50}\n\n".join(_format_article_content(item) for item in items)
     except Exception as e:
-        return f"Error marking articles as read: {str(e)}"
+        return f"Error getting article contents: {str(e)}"
 
 
 @mcp.tool()
-async def get_stats(ctx: Context) -> str:
-    """Get statistics about unread articles."""
+async def mark_as_read(ctx: Context, article_ids: list[str]) -> str:
+    """Mark articles as read.
+
+    Args:
+        article_ids: List of article IDs to mark as read
+    """
     try:
-        async with InoreaderClient() as client:
-            unread_counts = await client.get_unread_count()
+        if not article_ids:
+            return "No article IDs provided."
 
-            total_unread = 0
-            feed_stats = []
+        client = _get_client(ctx)
+        chunks = chunk_list(article_ids, 20)
 
-            for item in unread_counts:
-                count = item.get("count", 0)
-                if count > 0 and item.get("id", "").startswith("feed/"):
-                    total_unread += count
-                    feed_stats.append({"id": item["id"], "count": count})
+        # Dispatch chunk POSTs concurrently, bounded to stay within API rate limits.
+        semaphore = asyncio.Semaphore(8)
 
-            result = "**Inoreader Statistics:**\n\n"
-            result += f"Total unread articles: {total_unread}\n\n"
+        async def mark_chunk(chunk: list[str]) -> int:
+            async with semaphore:
+                return len(chunk) if await client.mark_as_read(chunk) else 0
 
-            if feed_stats:
-                feed_stats.sort(key=lambda x: x["count"], reverse=True)
+        results = await asyncio.gather(*(mark_chunk(chunk) for chunk in chunks))
+        success_count = sum(results)
 
-                result += "Top feeds with unread articles:\n"
-                for stat in feed_stats[:10]:
-                    feed_name = stat["id"].replace("feed/", "")
-                    if "://" in feed_name:
-                        feed_name = feed_name.split("://")[-1]
-                    result += f"- {feed_name}: {stat['count']} unread\n"
+        if success_count == len(article_ids):
+            return f"Successfully marked {success_count} article(s) as read."
+        elif success_count > 0:
+            return f"Marked {success_count} out of {len(article_ids)} articles as read."
+        else:
+            return "Failed to mark articles as read."
+    except Exception as e:
+        return f"Error marking articles as read: {str(e)}"
 
-            return result
+
+@mcp.tool()
+async def get_stats(ctx: Context) -> str:
+    """Get statistics about unread articles."""
+    try:
+        client = _get_client(ctx)
+        unread_counts = await client.get_unread_count()
+
+        total_unread = 0
+        feed_stats = []
+
+        for item in unread_counts:
+            count = item.get("count", 0)
+            if count > 0 and item.get("id", "").startswith("feed/"):
+                total_unread += count
+                feed_stats.append((count, item["id"]))
+
+        result = "**Inoreader Statistics:**\n\n"
+        result += f"Total unread articles: {total_unread}\n\n"
+
+        if feed_stats:
+            result += "Top feeds with unread articles:\n"
+            for count, feed_id in heapq.nlargest(10, feed_stats, key=itemgetter(0)):
+                # Ids look like "feed/https://example.com/rss"; strip the
+                # prefix and scheme in single slices.
+                feed_name = feed_id[5:]
+                scheme_end = feed_name.find("://")
+                if scheme_end != -1:
+                    feed_name = feed_name[scheme_end + 3 :]
+                result += f"- {feed_name}: {count} unread\n"
+
+        return result
     except Exception as e:
         return f"Error getting stats: {str(e)}"
@@ -1,40 +1,69 @@
 import re
-from datetime import datetime, timedelta
+import time
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Any
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_READ_STATE = "state/com.google/read"
+_EMPTY_DICT: dict = {}
+
+# Raw HTML is capped before tag stripping; the displayed summary is at most
+# 500 chars, so running the regex over a full article body would be wasted.
+_SUMMARY_HTML_CAP = 2000
+
 
 def parse_article(item: dict) -> dict:
     """Parse an article item into a simplified format."""
+    get = item.get
+
+    labels = []
+    is_read = False
+    for cat in get("categories", ()):
+        # The API returns category dicts uniformly; the exact type check is
+        # cheaper than isinstance and anything else takes the fallback branch.
+        if type(cat) is dict:
+            labels.append(cat.get("label", ""))
+            if _READ_STATE in cat.get("id", ""):
+                is_read = True
+        else:
+            cat = str(cat)
+            labels.append(cat)
+            if _READ_STATE in cat:
+                is_read = True
+
+    origin = get("origin") or _EMPTY_DICT
+
     article = {
-        "id": item.get("id", ""),
-        "title": item.get("title", "No title"),
-        "published": item.get("published", 0),
-        "published_date": (
-            datetime.fromtimestamp(item.get("published", 0)).isoformat() if item.get("published") else None
-        ),
-        "author": item.get("author", "Unknown"),
-        "feed_title": item.get("origin", {}).get("title", "Unknown feed"),
-        "feed_id": item.get("origin", {}).get("streamId", ""),
-        "categories": [
-            cat.get("label", "") if isinstance(cat, dict) else str(cat) for cat in item.get("categories", [])
-        ],
-        "is_read": any(
-            "state/com.google/read" in (cat.get("id", "") if isinstance(cat, dict) else str(cat))
-            for cat in item.get("categories", [])
-        ),
+        "id": get("id", ""),
+        "title": get("title", "No title"),
+        "published": get("published", 0),
+        "author": get("author", "Unknown"),
+        "feed_title": origin.get("title", "Unknown feed"),
+        "feed_id": origin.get("streamId", ""),
+        "categories": labels,
+        "is_read": is_read,
         "url": None,
         "summary": None,
     }
 
-    if "alternate" in item:
-        for alt in item["alternate"]:
+    alternate = get("alternate")
+    if alternate:
+        for alt in alternate:
             if alt.get("type") == "text/html":
                 article["url"] = alt.get("href")
                 break
 
-    if "summary" in item:
-        summary = item["summary"].get("content", "")
-        summary = re.sub("<[^<]+?>", "", summary)
+    summary_field = get("summary")
+    if summary_field:
+        raw = summary_field.get("content", "")
+        if len(raw) > _SUMMARY_HTML_CAP:
+            raw = raw[:_SUMMARY_HTML_CAP]
+            # Drop any tag the cap sliced through so no fragment survives.
+            cut = raw.rfind("<")
+            if cut != -1 and raw.find(">", cut) == -1:
+                raw = raw[:cut]
+        summary = _TAG_RE.sub("", raw)
         article["summary"] = summary[:500] + "..." if len(summary) > 500 else summary
 
     return article
@@ -52,10 +81,18 @@ def parse_feed(subscription: dict) -> dict:
     }
 
 
+def timestamp_to_iso(timestamp: int) -> str | None:
+    """Convert a Unix timestamp to an ISO date string."""
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+
 def days_to_timestamp(days: int) -> int:
     """Convert days to Unix timestamp."""
-    date = datetime.now() - timedelta(days=days)
-    return int(date.timestamp())
+    return int(time.time()) - days * 86400
+
+
+_STATUS_CHARS = ("•", "✓")
+_ARTICLE_TMPL = "%d. %s %s\n   Feed: %s\n   Date: %s\n   Link: %s\n"
 
 
 def format_article_list(articles: list[dict]) -> str:
@@ -63,19 +100,18 @@ def format_article_list(articles: list[dict]) -> str:
     if not articles:
         return "No articles found."
 
-    result = []
-    for i, article in enumerate(articles, 1):
-        status = "✓" if article["is_read"] else "•"
-        result.append(f"{i}. {status} {article['title']}")
-        result.append(f"   Feed: {article['feed_title']}")
-        result.append(f"   Date: {article['published_date']}")
-        if article["url"]:
-            result.append(f"   Link: {article['url']}")
-        else:
-            result.append("   Link: No URL available")
-        result.append("")
-
-    return "\n".join(result)
+    return "\n".join(
+        _ARTICLE_TMPL
+        % (
+            i,
+            _STATUS_CHARS[article["is_read"]],
+            article["title"],
+            article["feed_title"],
+            timestamp_to_iso(article["published"]),
+            article["url"] or "No URL available",
+        )
+        for i, article in enumerate(articles, 1)
+    )
 
 
 def format_feed_list(feeds: list[dict]) -> str:
@@ -83,15 +119,16 @@ def format_feed_list(feeds: list[dict]) -> str:
     if not feeds:
         return "No feeds found."
 
-    result = []
+    parts = []
     for i, feed in enumerate(feeds, 1):
-        result.append(f"{i}. {feed['title']}")
         if feed["categories"]:
-            result.append(f"   Categories: {', '.join(feed['categories'])}")
-        result.append(f"   URL: {feed['url']}")
-        result.append("")
+            parts.append(
+                f"{i}. {feed['title']}\n   Categories: {', '.join(feed['categories'])}\n   URL: {feed['url']}\n"
+            )
+        else:
+            parts.append(f"{i}. {feed['title']}\n   URL: {feed['url']}\n")
 
-    return "\n".join(result)
+    return "\n".join(parts)
 
 
 def extract_item_ids(articles: list[dict]) -> list[str]:
@@ -99,6 +136,7 @@ def extract_item_ids(articles: list[dict]) -> list[str]:
     return [article["id"] for article in articles if article.get("id")]
 
 
-def chunk_list(lst: list[Any], chunk_size: int) -> list[list[Any]]:
-    """Split a list into chunks."""
-    return [lst[i : i + chunk_size] for i in range(0, len(lst), chunk_size)]
+def chunk_list(lst: list[Any], chunk_size: int) -> Iterator[list[Any]]:
+    """Yield successive chunks of a list."""
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i : i + chunk_size]
@@ -86,7 +86,7 @@ class TestFormatArticleList:
             {
                 "title": "Article 1",
                 "feed_title": "Feed 1",
-                "published_date": "2024-01-01",
+                "published": 1700000000,
                 "url": "https://example.com/1",
                 "is_read": False,
             }
@@ -118,13 +118,13 @@ class TestExtractItemIds:
 
 class TestChunkList:
     def test_chunk_list_basic(self):
-        result = chunk_list([1, 2, 3, 4, 5], 2)
+        result = list(chunk_list([1, 2, 3, 4, 5], 2))
         assert result == [[1, 2], [3, 4], [5]]
 
     def test_chunk_list_empty(self):
-        result = chunk_list([], 2)
+        result = list(chunk_list([], 2))
         assert result == []
 
     def test_chunk_list_larger_chunk(self):
-        result = chunk_list([1, 2, 3], 5)
+        result = list(chunk_list([1, 2, 3], 5))
         assert result == [[1, 2, 3]]